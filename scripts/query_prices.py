@@ -66,6 +66,13 @@ Examples:
         help="Time interval for averaging. Default: 24h. Options: 5m, 1h, 6h, 24h.",
     )
 
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum number of queries in flight at once. Default: 4.",
+    )
+
     args = parser.parse_args()
 
     # reconstruct user-error string start/stop args, for example:
@@ -83,7 +90,10 @@ Examples:
     # call the batch query function
     try:
         query_prices_range(
-            time_start=time_start, time_stop=time_stop, timestep=args.timestep
+            time_start=time_start,
+            time_stop=time_stop,
+            timestep=args.timestep,
+            concurrency=args.concurrency,
         )
         print("\nPrice data query completed successfully!")
     except Exception as e:
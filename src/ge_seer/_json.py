@@ -0,0 +1,54 @@
+"""
+Thin JSON wrapper that uses orjson when it is installed and falls back to the standard
+library json module otherwise. Both paths serialize to and parse from bytes.
+"""
+
+try:
+    import orjson
+except ImportError:  # optional dependency, see `pip install osrs-ge-seer[fast]`
+    orjson = None
+    import json
+
+
+def dumps(obj, indent=False):
+    """
+    Serialize an object to JSON bytes. Non-string dict keys (e.g. integer item IDs)
+    are converted to strings, matching the behavior of the standard library.
+
+    Arguments:
+    ----------
+    obj : object
+        The JSON-serializable object.
+    indent : bool [False]
+        If True, pretty-prints the output with an indent of 2 spaces.
+
+    Returns:
+    --------
+    bytes
+        The UTF-8 encoded JSON document.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def loads(data):
+    """
+    Parse a JSON document from bytes or str.
+
+    Arguments:
+    ----------
+    data : bytes or str
+        The JSON document.
+
+    Returns:
+    --------
+    object
+        The parsed Python object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
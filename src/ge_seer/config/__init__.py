@@ -2,6 +2,7 @@ from .paths import (
     DEFAULT_BASE_DIR,
     DEFAULT_CONFIG_FILE,
     get_config_path,
+    ensure_dir,
 )
 from .manager import (
     save_config,
@@ -12,6 +13,7 @@ __all__ = [
     "DEFAULT_BASE_DIR",
     "DEFAULT_CONFIG_FILE",
     "get_config_path",
+    "ensure_dir",
     "save_config",
     "load_config",
 ]
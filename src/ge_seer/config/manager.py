@@ -1,6 +1,16 @@
-import json
 from pathlib import Path
-from .paths import get_config_path
+from .. import _json
+from .paths import ensure_dir, get_config_path
+
+# in-process copy of the config file, populated on first load or on save
+_CONFIG_CACHE = None
+
+
+def _with_derived_paths(config):
+    """Helper function to add pre-built Path objects to a loaded configuration."""
+    config = dict(config)
+    config["data_dir_path"] = Path(config["data_dir"]).expanduser().resolve()
+    return config
 
 
 def save_config(contact_info, contact_type, data_dir, verbose=True):
@@ -32,27 +42,49 @@ def save_config(contact_info, contact_type, data_dir, verbose=True):
 
     # ensure the user's chosen data directory exists
     resolved_data_path = Path(data_dir).expanduser().resolve()
-    resolved_data_path.mkdir(parents=True, exist_ok=True)
+    ensure_dir(resolved_data_path)
 
     # create the config file
+    global _CONFIG_CACHE
     config = {"user_agent": user_agent, "data_dir": str(resolved_data_path)}
-    with open(get_config_path(), "w") as f:
-        json.dump(config, f, indent=4)
+    config_path = get_config_path()
+    ensure_dir(config_path.parent)
+    with open(config_path, "wb") as f:
+        f.write(_json.dumps(config, indent=True))
+    _CONFIG_CACHE = _with_derived_paths(config)
 
     # status updates
     if verbose:
         print(f"OSRS Wiki API User-Agent set to: {user_agent}")
-        print(f"Configuration saved to {get_config_path()}")
+        print(f"Configuration saved to {config_path}")
         print(f"Data directory set to: {resolved_data_path}")
 
 
-def load_config():
+def load_config(refresh=False):
     """
-    Loads the user configurations from the JSON file created during setup.
+    Loads the user configurations from the JSON file created during setup. The file is
+    only read on the first call; subsequent calls return the cached configuration.
+
+    Arguments:
+    ----------
+    refresh : bool [False]
+        If True, re-reads the configuration file from disk, e.g. if it was edited by
+        hand or by another process.
+
+    Returns:
+    --------
+    dict
+        The user configuration, with keys "user_agent" and "data_dir" as saved in the
+        file, and "data_dir_path" with the data directory as a resolved Path.
     """
+    global _CONFIG_CACHE
+    if _CONFIG_CACHE is not None and not refresh:
+        return _CONFIG_CACHE
+
     path = get_config_path()
     if not path.exists():
         raise FileNotFoundError("Package not configured. Please run 'ge_seer.setup()'.")
 
-    with open(path, "r") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        _CONFIG_CACHE = _with_derived_paths(_json.loads(f.read()))
+    return _CONFIG_CACHE
@@ -1,18 +1,41 @@
+import os
 from pathlib import Path
 
 # default store config files in a hidden folder in user home directory
 DEFAULT_BASE_DIR = Path.home() / ".ge_seer"
 DEFAULT_CONFIG_FILE = DEFAULT_BASE_DIR / "config.json"
 
+# directories already created (or found to exist) by ensure_dir in this process
+_ENSURED_DIRS = set()
+
+
+def ensure_dir(path):
+    """
+    Create a directory (and any missing parents) if it doesn't exist. Directories are
+    only checked on disk the first time they are seen in a process, so repeated calls
+    for the same path are free. Assumes directories are not removed while the process
+    is running.
+
+    Arguments:
+    ----------
+    path : str or Path
+        Path to the directory.
+    """
+    key = str(path)
+    if key not in _ENSURED_DIRS:
+        os.makedirs(key, exist_ok=True)
+        _ENSURED_DIRS.add(key)
+
 
 def get_config_path():
     """
-    Get the path to the user configuration file, ensuring the directory exists.
+    Get the path to the user configuration file. The directory is not created here,
+    only when the configuration is first saved, so that importing the package or
+    reading the configuration has no side effects on disk.
 
     Returns:
     --------
     Path
         The path to the configuration file.
     """
-    DEFAULT_BASE_DIR.mkdir(parents=True, exist_ok=True)
     return DEFAULT_CONFIG_FILE
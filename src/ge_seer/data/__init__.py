@@ -1,27 +1,29 @@
-from .query import (
-    get_item_map,
-    get_static_values,
-    query_prices_instance,
-    query_prices_timeseries,
-    query_prices_range,
-)
-from .file_io import read_prices_data
-from .calculations import (
-    add_derived_price_columns,
-    add_alchemy_columns,
-    set_datetime_index,
-    rebin_to_ohlcv,
-)
+import importlib
 
-__all__ = [
-    "get_item_map",
-    "get_static_values",
-    "query_prices_instance",
-    "query_prices_timeseries",
-    "query_prices_range",
-    "read_prices_data",
-    "add_derived_price_columns",
-    "add_alchemy_columns",
-    "set_datetime_index",
-    "rebin_to_ohlcv",
-]
+# public functions and the submodule that defines them; submodules are only imported
+# on first access, so e.g. get_item_map does not pull in pandas or duckdb
+_EXPORTS = {
+    "get_item_map": "query",
+    "get_static_values": "query",
+    "query_prices_instance": "query",
+    "query_prices_timeseries": "query",
+    "query_prices_range": "query",
+    "read_prices_data": "file_io",
+    "add_derived_price_columns": "calculations",
+    "add_alchemy_columns": "calculations",
+    "set_datetime_index": "calculations",
+    "rebin_to_ohlcv": "calculations",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(f".{_EXPORTS[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
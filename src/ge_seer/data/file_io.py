@@ -1,4 +1,3 @@
-from pathlib import Path
 import pandas as pd
 import duckdb
 from ..config.manager import load_config
@@ -83,10 +82,10 @@ def read_prices_data(
     # read config file for data directory
     config = load_config()
     instance_root = (
-        Path(config["data_dir"]) / "prices_raw" / "instance" / f"timestep={timestep}"
+        config["data_dir_path"] / "prices_raw" / "instance" / f"timestep={timestep}"
     )
     timeseries_root = (
-        Path(config["data_dir"])
+        config["data_dir_path"]
         / "prices_raw"
         / "timeseries"
         / f"timestep={timestep}"
@@ -97,7 +96,7 @@ def read_prices_data(
     has_instance_data = (
         source in {"all", "instance"}
         and instance_root.exists()
-        and any(instance_root.glob("time=*/data.parquet"))
+        and any(instance_root.glob("*/*.parquet"))
     )
     has_timeseries_data = (
         source in {"all", "timeseries"}
@@ -123,9 +122,12 @@ def read_prices_data(
                 avgLowPrice,
                 lowPriceVolume,
                 1 AS source_priority
-            FROM read_parquet('{str(instance_root)}')
-            WHERE itemID = {item_id}
-                AND timestep = '{timestep}'{time_clauses}
+            FROM read_parquet(
+                '{str(instance_root)}/*/*.parquet',
+                hive_partitioning = false,
+                union_by_name = true
+            )
+            WHERE itemID = {item_id}{time_clauses}
             """
         )
     if has_timeseries_data:
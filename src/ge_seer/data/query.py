@@ -1,50 +1,364 @@
-import requests, json, time
-from pathlib import Path
-from functools import wraps
+import io, requests, threading, time, uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from email.utils import parsedate_to_datetime
 from glob import glob
-import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.json as pa_json
 import pyarrow.parquet as pq
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util.retry import Retry
+from .. import _json
 from ..config.manager import load_config
+from ..config.paths import ensure_dir
 from .time_utils import standardize_time_input, get_current_timestamp
-from .file_io import _empty_prices_df
 
 
-def rate_limit(min_interval=1.0):
+class TokenBucket:
     """
-    Decorator that enforces a minimum time interval between function calls.
+    Thread-safe token bucket rate limiter. Tokens are refilled continuously at `rate`
+    per second up to `capacity`, and each call to `acquire` consumes one token,
+    sleeping until one is available if the bucket is empty.
 
     Arguments:
     ----------
-    min_interval : float [1.0]
-        Minimum time in seconds between successive calls to the decorated function. If a
-        call is made too soon, the decorator sleeps to enforce the interval.
+    rate : float [1.0]
+        Number of tokens added to the bucket per second, i.e. the sustained call rate.
+    capacity : int [1]
+        Maximum number of tokens the bucket can hold, i.e. the largest allowed burst.
+    clock : callable [time.monotonic]
+        Function returning the current time in seconds. Should be monotonic so that
+        wall-clock adjustments (e.g. NTP) do not distort the interval.
     """
 
-    def decorator(func):
-        func._last_call_time = 0
+    def __init__(self, rate=1.0, capacity=1, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self._tokens = capacity
+        self._last_refill = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self.clock()
+        elapsed = now - self._last_refill
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._last_refill = now
+
+    def acquire(self):
+        """
+        Consume one token, sleeping until one is available. Waiting callers are served
+        one at a time, so concurrent threads are spaced out by the refill rate.
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                time.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    def pause(self, seconds):
+        """
+        Empty the bucket and hold off refilling for `seconds`, so that no caller gets a
+        token until then, e.g. after the server asks clients to back off.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, 0) - seconds * self.rate
+
+
+# the OSRS Wiki rate limit applies to all API requests combined, so every request made
+# by this module draws from this single limiter
+_LIMITER = TokenBucket(rate=1.0, capacity=1, clock=time.monotonic)
+
+
+# a single HTTP session is shared by all API requests, so that TCP/TLS connections to
+# the OSRS Wiki are kept alive and reused instead of re-established on every call
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session():
+    """
+    Helper function to get the shared requests.Session for OSRS Wiki API requests,
+    creating it on first use. Connection errors and server errors are retried with
+    exponential backoff; rate limit responses are handled by _api_get instead, so that
+    retries draw from the shared limiter. The User-Agent is synced with the user
+    configuration.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            retry = Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[500, 502, 503, 504],
+                raise_on_status=False,
+            )
+            _SESSION = requests.Session()
+            _SESSION.mount(
+                "https://",
+                HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry),
+            )
+        _SESSION.headers["User-Agent"] = load_config()["user_agent"]
+    return _SESSION
+
+
+# max number of times a request is retried after a rate limit (HTTP 429) response
+_RATE_LIMIT_RETRIES = 3
+
+
+def _retry_after_seconds(response, attempt):
+    """
+    Helper function to get how long to back off after a rate limit response, from its
+    Retry-After header (in seconds or as an HTTP date) or else exponential backoff.
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                retry_time = parsedate_to_datetime(retry_after)
+                return max(0.0, retry_time.timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    return 2.0**attempt
+
+
+def _api_get(url):
+    """
+    Helper function to send a GET request to the OSRS Wiki API. Each attempt draws a
+    token from the shared rate limiter; on a rate limit (HTTP 429) response the limiter
+    is paused for the requested time, so all threads back off, and the request is
+    retried up to _RATE_LIMIT_RETRIES times. Raises an error for bad responses.
+    """
+    for attempt in range(_RATE_LIMIT_RETRIES + 1):
+        _LIMITER.acquire()
+        response = _get_session().get(url)
+        if response.status_code != 429 or attempt == _RATE_LIMIT_RETRIES:
+            break
+        _LIMITER.pause(_retry_after_seconds(response, attempt))
+    response.raise_for_status()  # raise an error for bad responses
+    return response
+
+
+# length of each supported timestep in seconds
+_TIMESTEP_SECONDS = {"5m": 300, "1h": 3600, "6h": 21600, "24h": 86400}
+
+# instance snapshots are stored in a hive-partitioned dataset with one partition per
+# ~30 days of time, so that many snapshots share a few larger parquet files
+# path: data_dir/prices_raw/instance/timestep={timestep}/time_bucket={bucket}/*.parquet
+_TIME_BUCKET_SECONDS = 2592000
+_INSTANCE_MAX_ROWS_PER_FILE = 1_000_000
+
+# zstd compression, with dictionary encoding for the low-cardinality columns
+_INSTANCE_WRITE_OPTIONS = dict(
+    compression="zstd",
+    compression_level=3,
+    use_dictionary=["itemID", "time"],
+    data_page_size=1 << 20,
+)
+
+# price snapshot columns as returned by the API, and the extra columns stored on disk;
+# timestep is not stored in the files since it is already encoded in the path
+_PRICES_SCHEMA = pa.schema(
+    [
+        ("itemID", pa.string()),
+        ("avgHighPrice", pa.int64()),
+        ("highPriceVolume", pa.int64()),
+        ("avgLowPrice", pa.int64()),
+        ("lowPriceVolume", pa.int64()),
+    ]
+)
+_INSTANCE_SCHEMA = pa.schema(
+    list(_PRICES_SCHEMA)
+    + [
+        ("time", pa.int64()),
+        ("time_bucket", pa.int64()),
+    ]
+)
+
+
+def _prices_instance_table(table, query_time):
+    """Helper function to add the time columns to a price snapshot table for storage."""
+    n = table.num_rows
+    return pa.Table.from_arrays(
+        table.columns
+        + [
+            pa.array([query_time] * n, pa.int64()),
+            pa.array([query_time // _TIME_BUCKET_SECONDS] * n, pa.int64()),
+        ],
+        schema=_INSTANCE_SCHEMA,
+    )
+
+
+def _write_prices_instance(tables, data_dir, timestep):
+    """
+    Helper function to append price snapshot tables to the instance dataset on disk.
+    All tables are written together, creating one new file per time bucket touched.
+    """
+    import pyarrow.dataset as ds  # deferred, imports pandas
+
+    ds.write_dataset(
+        pa.concat_tables(tables),
+        data_dir / "prices_raw" / "instance" / f"timestep={timestep}",
+        format="parquet",
+        partitioning=ds.partitioning(
+            pa.schema([("time_bucket", pa.int64())]), flavor="hive"
+        ),
+        basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+        file_options=ds.ParquetFileFormat().make_write_options(
+            **_INSTANCE_WRITE_OPTIONS
+        ),
+        max_rows_per_file=_INSTANCE_MAX_ROWS_PER_FILE,
+        max_rows_per_group=_INSTANCE_MAX_ROWS_PER_FILE,
+        existing_data_behavior="overwrite_or_ignore",
+    )
 
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            elapsed = time.time() - func._last_call_time
-            if elapsed < min_interval:
-                sleep_time = min_interval - elapsed
-                time.sleep(sleep_time)
 
-            func._last_call_time = time.time()
-            return func(*args, **kwargs)
+def _remove_prices_instance_time(data_dir, timestep, query_time):
+    """
+    Helper function to remove any stored rows for a snapshot time from the instance
+    dataset, so that storing it again replaces the old snapshot instead of adding a
+    duplicate. Affected files are rewritten without those rows, or deleted if empty.
+    """
+    instance_root = data_dir / "prices_raw" / "instance" / f"timestep={timestep}"
+
+    # older one-file-per-snapshot layout
+    legacy_file = instance_root / f"time={query_time}" / "data.parquet"
+    if legacy_file.exists():
+        legacy_file.unlink()
+        try:
+            legacy_file.parent.rmdir()
+        except OSError:  # directory still holds other files
+            pass
+
+    # only files in the snapshot's time bucket can contain it
+    bucket_dir = instance_root / f"time_bucket={query_time // _TIME_BUCKET_SECONDS}"
+    for file in bucket_dir.glob("*.parquet"):
+        with pq.ParquetFile(file) as parquet_file:
+            times = parquet_file.read(columns=["time"]).column("time")
+            if not pc.any(pc.equal(times, query_time)).as_py():
+                continue
+            kept = parquet_file.read()
+
+        kept = kept.filter(pc.not_equal(kept["time"], query_time))
+        if kept.num_rows == 0:
+            file.unlink()
+            continue
+
+        # write to a unique temporary name first so a failed write never loses the
+        # file and concurrent rewrites do not clobber each other's temporary files
+        tmp_file = file.with_name(f"{file.stem}-{uuid.uuid4().hex}.tmp")
+        pq.write_table(kept, tmp_file, **_INSTANCE_WRITE_OPTIONS)
+        tmp_file.replace(file)
+
+
+def _get_queried_instance_times(data_dir, timestep, time_start, time_stop):
+    """
+    Helper function to get the set of timestamps within [time_start, time_stop] already
+    stored in the instance dataset for a timestep. Only the time buckets overlapping
+    the range are read. Also recognizes the older one-file-per-snapshot layout
+    (timestep={timestep}/time={time}/data.parquet) by its directory names.
+    """
+    instance_root = data_dir / "prices_raw" / "instance" / f"timestep={timestep}"
+
+    # older layout, the time is encoded in the directory name
+    queried_times = set()
+    for file in instance_root.glob("time=*/data.parquet"):
+        query_time = int(file.parent.name.split("=", 1)[1])
+        if time_start <= query_time <= time_stop:
+            queried_times.add(query_time)
+
+    # time bucket partitions overlapping the range
+    queried_files = []
+    for bucket in range(
+        time_start // _TIME_BUCKET_SECONDS, time_stop // _TIME_BUCKET_SECONDS + 1
+    ):
+        bucket_dir = instance_root / f"time_bucket={bucket}"
+        queried_files += glob(str(bucket_dir / "*.parquet"))
+    if not queried_files:
+        return queried_times
+
+    import pyarrow.dataset as ds  # deferred, imports pandas
+
+    times = ds.dataset(queried_files, format="parquet").to_table(columns=["time"])
+    times = pc.unique(times.column("time")).to_pylist()
+    queried_times.update(t for t in times if time_start <= t <= time_stop)
+    return queried_times
+
+
+# time-series columns as returned by the API; "timestamp" is stored as "time"
+_TIMESERIES_RESPONSE_SCHEMA = pa.schema(
+    [
+        ("timestamp", pa.int64()),
+        ("avgHighPrice", pa.int64()),
+        ("highPriceVolume", pa.int64()),
+        ("avgLowPrice", pa.int64()),
+        ("lowPriceVolume", pa.int64()),
+    ]
+)
+
+# columns kept from the item mapping response for the item map
+_ITEM_MAP_SCHEMA = pa.schema([("id", pa.int32()), ("name", pa.string())])
+
+# columns kept from the item mapping response for the static values
+_STATIC_VALUES_SCHEMA = pa.schema(
+    [
+        ("id", pa.int32()),
+        ("lowalch", pa.int64()),
+        ("highalch", pa.int64()),
+        ("value", pa.int64()),
+    ]
+)
 
-        return wrapper
 
-    return decorator
+def _read_mapping_response(content, schema):
+    """
+    Helper function to parse the item mapping response, a JSON array of item objects,
+    directly into a table with the given schema, skipping the intermediate Python
+    objects. The Arrow JSON reader expects one JSON object per row, so the array is
+    wrapped as a single object and read as one row, then flattened to one row per
+    item. Fields not in the schema are ignored.
+    """
+    payload = b'{"items":' + content + b"}"
+    table = pa_json.read_json(
+        io.BytesIO(payload),
+        read_options=pa_json.ReadOptions(use_threads=False, block_size=len(payload)),
+        parse_options=pa_json.ParseOptions(
+            explicit_schema=pa.schema([("items", pa.list_(pa.struct(schema)))]),
+            unexpected_field_behavior="ignore",
+            newlines_in_values=True,
+        ),
+    )
+    return pa.Table.from_struct_array(pc.list_flatten(table.column("items")))
+
+
+@lru_cache(maxsize=1)
+def _load_item_map_from_disk(item_map_path):
+    """Helper function to load the locally stored item mapping, cached in-process."""
+    # ParquetFile reads a single file without pq.read_table's dataset machinery, which
+    # would import pandas
+    with pq.ParquetFile(item_map_path) as parquet_file:
+        table = parquet_file.read()
+    return dict(
+        zip(
+            table.column("id").cast(pa.string()).to_pylist(),
+            table.column("name").to_pylist(),
+        )
+    )
 
 
 def get_item_map(force_refresh=False):
     """
     Retrieves the mapping of item IDs to human-readable names from the OSRS Wiki API.
     The first time this function is called, it will fetch the data using the API and
-    create a local file to store the mapping. Subsequent calls will load from this file.
+    create a local file to store the mapping. Subsequent calls will load from this file,
+    which is only read once per process; the same dict is returned on repeated calls, so
+    copy it before modifying.
 
     Arguments:
     ----------
@@ -57,29 +371,22 @@ def get_item_map(force_refresh=False):
     item_map : dict
         A dictionary mapping item IDs (str of integer) to item names (str).
     """
-    # load user configuration for user-agent for API requests
+    # load user configuration for data directory path
     config = load_config()
-    data_dir = config["data_dir"]
-    headers = {"User-Agent": config["user_agent"]}
+    data_dir = config["data_dir_path"]
 
     # fetch the item mapping if the file doesn't exist or if force_refresh is True
-    item_map_path = Path(data_dir) / "item_map.json"
+    item_map_path = data_dir / "item_map.parquet"
     if force_refresh or not item_map_path.exists():
-        response = requests.get(
-            "https://prices.runescape.wiki/api/v1/osrs/mapping",
-            headers=headers,
-        )
-        response.raise_for_status()  # raise an error for bad responses
+        response = _api_get("https://prices.runescape.wiki/api/v1/osrs/mapping")
 
-        # save the mapping
-        item_map = {item["id"]: item["name"] for item in response.json()}
-        with open(item_map_path, "w") as f:
-            json.dump(item_map, f, indent=4)
+        # save the mapping as a two-column table
+        table = _read_mapping_response(response.content, _ITEM_MAP_SCHEMA)
+        pq.write_table(table, item_map_path, compression="zstd")
+        _load_item_map_from_disk.cache_clear()
 
     # return the mapping from the file
-    with open(item_map_path, "r") as f:
-        item_map = json.load(f)
-    return item_map
+    return _load_item_map_from_disk(item_map_path)
 
 
 def get_static_values(force_refresh=False):
@@ -107,48 +414,69 @@ def get_static_values(force_refresh=False):
             "value" : int, Jagex-defined value
         Example: {"4151":{"lowalch": 48000, "highalch": 72000, "value": 120001}}
     """
-    # load user configuration for user-agent for API requests
+    # load user configuration for data directory path
     config = load_config()
-    data_dir = config["data_dir"]
-    headers = {"User-Agent": config["user_agent"]}
+    data_dir = config["data_dir_path"]
 
     # fetch the static values if the file doesn't exist or if force_refresh is True
-    static_values_path = Path(data_dir) / "static_values.json"
+    static_values_path = data_dir / "static_values.parquet"
     if force_refresh or not static_values_path.exists():
-        response = requests.get(
-            "https://prices.runescape.wiki/api/v1/osrs/mapping",
-            headers=headers,
+        response = _api_get("https://prices.runescape.wiki/api/v1/osrs/mapping")
+
+        # save the static values as a table
+        table = _read_mapping_response(response.content, _STATIC_VALUES_SCHEMA)
+        pq.write_table(table, static_values_path, compression="zstd")
+
+    # return the static values from the file, with the per-item dicts built by pyarrow
+    with pq.ParquetFile(static_values_path) as parquet_file:
+        table = parquet_file.read()
+    static_values = dict(
+        zip(
+            table.column("id").cast(pa.string()).to_pylist(),
+            table.select(["lowalch", "highalch", "value"]).to_pylist(),
         )
-        response.raise_for_status()  # raise an error for bad responses
-
-        # save the static values
-        static_values = {
-            item["id"]: {
-                "lowalch": item.get("lowalch"),
-                "highalch": item.get("highalch"),
-                "value": item.get("value"),
-            }
-            for item in response.json()
-        }
-        with open(static_values_path, "w") as f:
-            json.dump(static_values, f, indent=4)
-
-    # return the static values from the file
-    with open(static_values_path, "r") as f:
-        static_values = json.load(f)
+    )
     return static_values
 
 
-@rate_limit(min_interval=1.0)
+def _query_prices_instance_table(query_time, timestep):
+    """
+    Helper function to fetch a price snapshot from the OSRS Wiki GE API as a table with
+    _PRICES_SCHEMA. The response is unpacked into one list per column in a single pass
+    and converted directly to Arrow arrays, without building an intermediate DataFrame.
+    """
+    # query the price data for the specified time and timestep
+    response = _api_get(
+        f"https://prices.runescape.wiki/api/v1/osrs/{timestep}?timestamp={query_time}"
+    )
+
+    # unpack {itemID: {column: value}} into columns, missing values become nulls
+    data = _json.loads(response.content)["data"]
+    ids, avg_high, high_vol, avg_low, low_vol = [], [], [], [], []
+    for item_id, prices in data.items():
+        ids.append(item_id)
+        avg_high.append(prices.get("avgHighPrice"))
+        high_vol.append(prices.get("highPriceVolume"))
+        avg_low.append(prices.get("avgLowPrice"))
+        low_vol.append(prices.get("lowPriceVolume"))
+
+    columns = [ids, avg_high, high_vol, avg_low, low_vol]
+    return pa.Table.from_arrays(
+        [pa.array(col, field.type) for col, field in zip(columns, _PRICES_SCHEMA)],
+        schema=_PRICES_SCHEMA,
+    )
+
+
 def query_prices_instance(query_time, timestep="24h", store=True):
     """
     Fetch price data from the OSRS Wiki GE API for all items at some instant in time.
     Data consists of the high and low prices each item averaged over the specified
     timestep, as well as the volume traded during that period.
 
-    NOTE: This function is rate-limited to max 1 call per second (enforced by decorator)
-    according to OSRS Wiki guidelines. If called more frequently, it will automatically
-    sleep to enforce the constraint.
+    NOTE: This function is rate-limited to max 1 call per second according to OSRS
+    Wiki guidelines. The limit is shared with all other API requests made by this
+    module; if called more frequently, it will automatically sleep to enforce the
+    constraint. Rate limit (HTTP 429) responses are retried after the requested delay.
 
     For more info: https://oldschool.runescape.wiki/w/RuneScape:Real-time_Prices
 
@@ -161,85 +489,63 @@ def query_prices_instance(query_time, timestep="24h", store=True):
     timestep : str ["24h"]
         The time interval for price averaging. Options: "5m", "1h", "6h", "24h"
     store : bool [True]
-        If True, stores the queried data as a parquet file in the user's data directory,
-        organized by timestep and time.
+        If True, stores the queried data in the parquet dataset in the user's data
+        directory, partitioned by timestep and ~30 day time buckets. A snapshot that
+        was already stored for the same time and timestep is replaced.
 
     Returns:
     --------
     pd.DataFrame
-        A DataFrame containing the price data for all items at the specified time, with
-        columns:
+        A DataFrame containing the price data for all items at the specified time,
+        indexed by item ID (str of integer), with columns:
             "itemID" : str of integer item ID
             "avgHighPrice" : int, volume-weighted average of instant-buy transactions
             "highPriceVolume" : int, volume of instant-buy transactions
             "avgLowPrice" : int, volume-weighted average of instant-sell transactions
             "lowPriceVolume" : int, volume of instant-sell transactions
     """
-    # load user configuration for user-agent for API requests
+    import pandas as pd
+
+    # load user configuration for data directory path
     config = load_config()
-    headers = {"User-Agent": config["user_agent"]}
-    data_dir = Path(config["data_dir"])
+    data_dir = config["data_dir_path"]
 
     # standardize the query_time input to a Unix timestamp
     query_time = standardize_time_input(query_time)
 
     # check that the timestamp is an integer multiple of the timestep
-    timestep_seconds = {"5m": 300, "1h": 3600, "6h": 21600, "24h": 86400}
-    if query_time % timestep_seconds[timestep] != 0:
+    if query_time % _TIMESTEP_SECONDS[timestep] != 0:
         raise ValueError(
             f"Time must be an integer multiple of the timestep ({timestep})."
         )
 
     # query the price data for the specified time and timestep
-    response = requests.get(
-        f"https://prices.runescape.wiki/api/v1/osrs/{timestep}?timestamp={query_time}",
-        headers=headers,
-    )
-    response.raise_for_status()  # raise an error for bad responses
-
-    # convert the response to a DataFrame, catch empty data
-    df = pd.DataFrame(response.json()["data"]).T
-    if len(df) == 0:
-        df = _empty_prices_df()
+    table = _query_prices_instance_table(query_time, timestep)
 
-    # add relevant columns to the DataFrame
-    df["itemID"] = df.index
-    df["timestep"] = timestep
-    df["time"] = query_time
-    df = df.convert_dtypes()
-
-    # store the data if requested
-    # path: data_dir/prices_raw/instance/timestep={timestep}/time={time}/data.parquet
+    # store the data if requested, replacing any previous snapshot for the same time
     if store:
-        partition_dir = (
-            data_dir
-            / "prices_raw"
-            / "instance"
-            / f"timestep={timestep}"
-            / f"time={query_time}"
+        _remove_prices_instance_time(data_dir, timestep, query_time)
+        _write_prices_instance(
+            [_prices_instance_table(table, query_time)], data_dir, timestep
         )
-        partition_dir.mkdir(parents=True, exist_ok=True)
-
-        # write to a single fixed-name file, overwrites if it already exists
-        table = pa.Table.from_pandas(df)
-        output_file = partition_dir / "data.parquet"
-        pq.write_table(table, output_file)
 
-    # return the DataFrame
-    return df[
-        ["itemID", "avgHighPrice", "highPriceVolume", "avgLowPrice", "lowPriceVolume"]
-    ]
+    # return the data as a DataFrame indexed by item ID, with the same dtypes as
+    # DataFrame.convert_dtypes()
+    pandas_types = {pa.int64(): pd.Int64Dtype(), pa.string(): pd.StringDtype()}
+    df = table.to_pandas(types_mapper=pandas_types.get)
+    df.index = pd.Index(table.column("itemID").to_pylist())
+    return df
 
 
-@rate_limit(min_interval=1.0)
 def query_prices_timeseries(item_id, timestep="24h", store=True):
     """
     Fetch time-series price data from the OSRS Wiki GE API for a single item. Returns
     up to the 365 most recent samples at the requested timestep.
 
-    NOTE: This function is rate-limited to max 1 call per second (enforced by decorator)
-    according to OSRS Wiki guidelines. If called more frequently, it will automatically
-    sleep to enforce the constraint.
+    NOTE: This function is rate-limited to max 1 call per second according to OSRS
+    Wiki guidelines. The limit is shared with all other API requests made by this
+    module; if called more frequently, it will automatically sleep to enforce the
+    constraint. Rate limit (HTTP 429) responses are retried after the requested delay.
 
     WARNING: This endpoint is intended for querying one item across many recent time
     samples. If you need many time instances for many items, use query_prices_range,
@@ -268,36 +574,33 @@ def query_prices_timeseries(item_id, timestep="24h", store=True):
             "avgLowPrice" : int, volume-weighted average of instant-sell transactions
             "lowPriceVolume" : int, volume of instant-sell transactions
     """
+    import pandas as pd
+
     valid_timesteps = {"5m", "1h", "6h", "24h"}
     if timestep not in valid_timesteps:
         raise ValueError(
             f"Invalid timestep: {timestep}. Must be one of {sorted(valid_timesteps)}"
         )
 
-    # load user configuration for user-agent for API requests
+    # load user configuration for data directory path
     config = load_config()
-    headers = {"User-Agent": config["user_agent"]}
-    data_dir = Path(config["data_dir"])
+    data_dir = config["data_dir_path"]
 
     # query the time-series price data for the specified item and timestep
-    response = requests.get(
+    response = _api_get(
         "https://prices.runescape.wiki/api/v1/osrs/timeseries?timestep=%s&id=%s"
-        % (timestep, item_id),
-        headers=headers,
+        % (timestep, item_id)
     )
-    response.raise_for_status()  # raise an error for bad responses
 
-    # convert the response to a DataFrame, catch empty data
-    df = pd.DataFrame(response.json()["data"])
-    if len(df) == 0:
-        df = _empty_prices_df()
-    else:
-        df = df.rename(columns={"timestamp": "time"})
-        df = df.convert_dtypes()
+    # convert the records in the response directly to a table, missing values become
+    # nulls and empty data gives an empty table with the same columns
+    records = _json.loads(response.content)["data"]
+    table = pa.Table.from_pylist(records, schema=_TIMESERIES_RESPONSE_SCHEMA)
+    table = table.rename_columns(["time"] + table.column_names[1:])
 
     # store only unique samples if requested
     # path: data_dir/prices_raw/timeseries/timestep={timestep}/itemID={item_id}/time={latest_time}.parquet
-    if store and len(df) > 0:
+    if store and table.num_rows > 0:
         partition_dir = (
             data_dir
             / "prices_raw"
@@ -305,38 +608,42 @@ def query_prices_timeseries(item_id, timestep="24h", store=True):
             / f"timestep={timestep}"
             / f"itemID={item_id}"
         )
-        partition_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(partition_dir)
 
         # gather existing time samples already stored for this timestep/item partition
         existing_times = set()
         existing_files = partition_dir.glob("*.parquet")
         for file in existing_files:
-            table = pq.read_table(file, columns=["time"])
-            if table.num_rows > 0:
-                existing_times.update(table.column("time").to_pylist())
+            existing = pq.read_table(file, columns=["time"])
+            if existing.num_rows > 0:
+                existing_times.update(existing.column("time").to_pylist())
 
         # filter down to only new time samples
-        df_to_store = df[~df["time"].isin(existing_times)].copy()
+        existing_times = pa.array(list(existing_times), pa.int64())
+        is_new = pc.invert(pc.is_in(table["time"], value_set=existing_times))
+        table_to_store = table.filter(is_new)
 
         # save only if new unique samples exist; file name uses latest saved sample time
-        if len(df_to_store) > 0:
-            latest_time = int(df_to_store["time"].max())
+        if table_to_store.num_rows > 0:
+            latest_time = pc.max(table_to_store["time"]).as_py()
             output_file = partition_dir / f"time={latest_time}.parquet"
-            table = pa.Table.from_pandas(df_to_store)
-            pq.write_table(table, output_file)
+            pq.write_table(table_to_store, output_file, compression="zstd")
 
-    # return the queried DataFrame
-    return df[
-        ["time", "avgHighPrice", "highPriceVolume", "avgLowPrice", "lowPriceVolume"]
-    ]
+    # return the queried data as a DataFrame
+    pandas_types = {pa.int64(): pd.Int64Dtype()}
+    return table.to_pandas(types_mapper=pandas_types.get)
 
 
-def query_prices_range(time_start=None, time_stop=None, timestep="24h"):
+def query_prices_range(time_start=None, time_stop=None, timestep="24h", concurrency=4):
     """
     Wrapper for query_prices_instance to batch query and store price data for all valid
     time instances within a range, inclusively. Data is automatically stored to disk in
     the directory specified during setup. Query is rate-limited to max 1 per second.
 
+    Queries are issued from a pool of worker threads. The rate limit still applies to
+    all workers combined, but a new request can be sent while earlier ones are still
+    waiting on the network or being written to disk, rather than one at a time.
+
     Arguments:
     ----------
     time_start : int or str [None]
@@ -347,9 +654,14 @@ def query_prices_range(time_start=None, time_stop=None, timestep="24h"):
         should be formatted "YYYY-MM-DD HH:MM:SS UTC". Default: now.
     timestep : str ["24h"]
         The time interval for price averaging. Options: "5m", "1h", "6h", "24h"
+    concurrency : int [4]
+        Maximum number of queries in flight at once.
     """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}.")
+
     # define timestep in seconds
-    step_size = {"5m": 300, "1h": 3600, "6h": 21600, "24h": 86400}[timestep]
+    step_size = _TIMESTEP_SECONDS[timestep]
 
     # format start/stop times; defaults: stop = now, start = 30 timesteps before stop
     time_stop = get_current_timestamp() if time_stop is None else time_stop
@@ -374,26 +686,46 @@ def query_prices_range(time_start=None, time_stop=None, timestep="24h"):
 
     # load user configuration for data directory path
     config = load_config()
-    data_dir = Path(config["data_dir"])
+    data_dir = config["data_dir_path"]
 
     # get all valid timestamps not yet queried and saved in the range
     all_timestamps = set(range(time_start, time_stop + 1, step_size))
-    queried_files = glob(
-        str(
-            data_dir
-            / "prices_raw"
-            / "instance"
-            / f"timestep={timestep}"
-            / "time=*/data.parquet"
-        )
-    )
-    queried_timestamps = set(
-        [int(Path(file).parent.name.split("=")[1]) for file in queried_files]
+    queried_timestamps = _get_queried_instance_times(
+        data_dir, timestep, time_start, time_stop
     )
     timestamps_to_query = all_timestamps - queried_timestamps
 
-    # Query and store data for each timestamp that needs to be queried
-    for query_time in tqdm(
-        timestamps_to_query, desc=f"Querying {timestep} prices", unit=" queries"
-    ):
-        query_prices_instance(query_time=query_time, timestep=timestep, store=True)
+    def query_table(query_time):
+        table = _query_prices_instance_table(query_time, timestep)
+        return _prices_instance_table(table, query_time)
+
+    # query data for each timestamp that needs to be queried, buffering the results
+    # so that many snapshots are written to disk together in a few larger files
+    buffered_tables = []
+    buffered_rows = 0
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [
+            executor.submit(query_table, query_time)
+            for query_time in sorted(timestamps_to_query)
+        ]
+        try:
+            for future in tqdm(
+                as_completed(futures),
+                total=len(futures),
+                desc=f"Querying {timestep} prices",
+                unit=" queries",
+            ):
+                table = future.result()  # re-raise any error from the worker thread
+                buffered_tables.append(table)
+                buffered_rows += table.num_rows
+                if buffered_rows >= _INSTANCE_MAX_ROWS_PER_FILE:
+                    tables, buffered_tables, buffered_rows = buffered_tables, [], 0
+                    _write_prices_instance(tables, data_dir, timestep)
+        except BaseException:
+            # drop queued queries instead of waiting for them on the way out
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        finally:
+            # keep whatever was already queried, even if the batch was interrupted
+            if buffered_tables:
+                _write_prices_instance(buffered_tables, data_dir, timestep)
@@ -1,5 +1,4 @@
 from datetime import datetime, timezone
-import pandas as pd
 
 
 def get_current_timestamp():
@@ -26,6 +25,8 @@ def timestamp_to_datetime(time, as_string=True):
     str, datetime, or pd.Series
         Converted datetime representation.
     """
+    import pandas as pd
+
     format_str = "%Y-%m-%d %H:%M:%S UTC"
 
     # vectorized conversion for pandas objects
@@ -56,6 +57,23 @@ def datetime_to_timestamp(time):
     int or pd.Series
         Corresponding Unix timestamp value(s) in seconds.
     """
+    # fast path for ISO 8601 strings such as "YYYY-MM-DD HH:MM:SS UTC", which does not
+    # need pandas; anything else falls back to the more flexible pandas parser below
+    if isinstance(time, str):
+        iso_time = time.strip()
+        if iso_time.endswith(" UTC"):
+            iso_time = iso_time[:-4] + "+00:00"
+        try:
+            converted = datetime.fromisoformat(iso_time)
+        except ValueError:
+            pass
+        else:
+            if converted.tzinfo is None:
+                converted = converted.replace(tzinfo=timezone.utc)
+            return int(converted.timestamp())
+
+    import pandas as pd
+
     # vectorized conversion for pandas/list-like objects
     if isinstance(time, (pd.Series, pd.Index, list, tuple)):
         return (time - pd.Timestamp("1970-01-01", tz='utc')) // pd.Timedelta("1s")
@@ -117,6 +135,8 @@ def timestep_to_timedelta(timestep):
     pd.Timedelta
         Corresponding pandas Timedelta object.
     """
+    import pandas as pd
+
     rule = normalize_timestep_rule(timestep)
     try:
         return pd.to_timedelta(rule)